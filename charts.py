@@ -0,0 +1,85 @@
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from data import FRAME_HASH_FUNCS, precompute
+
+def top_pickups_chart(top_pickups):
+    fig = px.bar(
+        top_pickups,
+        x="trip_count",
+        y="Zone",
+        orientation="h",
+        color_discrete_sequence=["skyblue"],
+        labels={"trip_count": "Number of Trips", "Zone": ""},
+        title="Top 10 Pickup Zones by Trip Count",
+    )
+    fig.update_yaxes(autorange="reversed")
+    return fig
+
+def avg_fare_chart(avg_fare_by_hour):
+    return px.line(
+        avg_fare_by_hour,
+        x="pickup_hour",
+        y="avg_fare",
+        markers=True,
+        color_discrete_sequence=["skyblue"],
+        labels={"pickup_hour": "Hour of Day", "avg_fare": "Average Fare ($)"},
+        title="Average Fare by Hour of Day",
+    )
+
+def distance_hist_chart(distance_counts, distance_edges):
+    fig = go.Figure(go.Bar(
+        x=distance_edges[:-1],
+        y=distance_counts,
+        width=np.diff(distance_edges),
+        offset=0,
+        marker=dict(color="skyblue", line=dict(color="black", width=1)),
+    ))
+    fig.update_layout(
+        title="Distribution of Trip Distances",
+        xaxis_title="Trip Distance (miles)",
+        yaxis_title="Number of Trips",
+        bargap=0,
+    )
+    return fig
+
+def payments_chart(payment_counts):
+    fig = px.bar(
+        payment_counts,
+        x="payment_type",
+        y="count",
+        color_discrete_sequence=["skyblue"],
+        labels={"payment_type": "Payment Type", "count": "Number of Trips"},
+        title="Breakdown of Payment Types",
+    )
+    fig.update_xaxes(type="category")
+    return fig
+
+def heatmap_chart(heatmap_matrix):
+    fig = px.imshow(
+        heatmap_matrix,
+        x=list(range(24)),
+        y=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+        aspect="auto",
+        color_continuous_scale="viridis",
+        labels={"x": "Hour of Day", "y": "Day of Week", "color": "Number of Trips"},
+        title="Trips by Day of Week and Hour",
+    )
+    fig.update_xaxes(dtick=1)
+    return fig
+
+# Plotly figures ship to the browser as JSON, so cache them alongside the
+# aggregations rather than re-rasterizing a matplotlib PNG on every rerun
+@st.cache_data(hash_funcs=FRAME_HASH_FUNCS)
+def build_figures(df, zones_df):
+    agg = precompute(df, zones_df)
+
+    return dict(
+        top_pickups=top_pickups_chart(agg["top_pickups"]),
+        avg_fare=avg_fare_chart(agg["avg_fare"]),
+        hist=distance_hist_chart(*agg["hist"]),
+        payments=payments_chart(agg["payments"]),
+        heatmap=heatmap_chart(agg["heatmap"]),
+    )
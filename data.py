@@ -0,0 +1,238 @@
+import os
+import shutil
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import requests
+import streamlit as st
+
+tripData = "https://d37ci6vzurychx.cloudfront.net/trip-data/yellow_tripdata_2024-01.parquet"
+zoneLookup = "https://d37ci6vzurychx.cloudfront.net/misc/taxi_zone_lookup.csv"
+
+tripDataPath = "yellow_tripdata_2024-01.parquet"
+zoneLookupPath = "taxi_zone_lookup.csv"
+zoneLookupParquetPath = "taxi_zone_lookup.parquet"
+
+TRIP_COLUMNS = [
+    "tpep_pickup_datetime",
+    "tpep_dropoff_datetime",
+    "PULocationID",
+    "payment_type",
+    "fare_amount",
+    "tip_amount",
+    "total_amount",
+    "trip_distance",
+]
+
+SAMPLE_EVERY = 50
+SAMPLE_SIZE = 100_000
+
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# The sample comes back from st.cache_data as a fresh copy on every rerun, so
+# key the downstream caches on its size rather than hashing every row
+FRAME_HASH_FUNCS = {pl.DataFrame: lambda d: d.estimated_size()}
+
+@st.cache_resource
+def ensure_file(url, dest):
+  # Skip the download if a non-empty copy is already on disk
+  if os.path.exists(dest) and os.path.getsize(dest) > 0:
+    return dest
+  # Stream straight to disk instead of buffering the whole body in memory
+  with requests.get(url, stream=True, timeout=60) as response:
+    response.raise_for_status()
+    tmp = dest + ".part"
+    with open(tmp, "wb") as f:
+      shutil.copyfileobj(response.raw, f, length=1 << 20)
+    os.replace(tmp, dest)
+  print("file downloaded")
+  return dest
+
+@st.cache_resource
+def ensure_parquet(csv_path, dest):
+  # Parse the CSV once and keep a typed, compressed copy for later runs
+  if not os.path.exists(dest):
+    pl.read_csv(csv_path).write_parquet(dest, compression="zstd", compression_level=3, statistics=True)
+  return dest
+
+def add_features(df):
+    df = df.with_columns(
+        ((pl.col("tpep_dropoff_datetime") - pl.col("tpep_pickup_datetime"))
+         .dt.total_seconds() / 60)
+        .cast(pl.Float32)
+        .alias("trip_duration_minutes")
+    )
+
+    return df.with_columns([
+
+        pl.when(pl.col("trip_duration_minutes") > 0)
+          .then(pl.col("trip_distance") / (pl.col("trip_duration_minutes") / 60))
+          .otherwise(0)
+          .alias("trip_speed_mph"),
+
+        pl.col("tpep_pickup_datetime").dt.hour().alias("pickup_hour"),
+
+        pl.col("tpep_pickup_datetime").dt.strftime("%A").cast(pl.Enum(WEEKDAY_NAMES)).alias("pickup_day_of_week")
+    ])
+
+@st.cache_data
+def load_data():
+    ensure_file(tripData, tripDataPath)
+
+    try:
+        # First try the local copy in the dashboard folder
+        lf = pl.scan_parquet(tripDataPath)
+    except FileNotFoundError:
+        try:
+            # Maybe it's in the parent directory?
+            lf = pl.scan_parquet('../yellow_tripdata_2024-01.parquet')
+        except FileNotFoundError:
+            # Okay, we're stuck - let the user know what's up
+            st.error("Can't find the dataset! Make sure 'taxi_data.parquet' is in the dashboard folder.")
+            st.stop()
+
+    df = (
+        lf
+        # Deterministic ~2% sample, applied while the file is scanned. Hashing
+        # the row index rather than the pickup time keeps trips that share a
+        # timestamp from being kept or dropped as a block
+        .with_row_index("__rid")
+        .filter(pl.col("__rid").hash(seed=42) % SAMPLE_EVERY == 0)
+        # Only decode the columns the dashboard actually uses
+        .select(TRIP_COLUMNS)
+        .with_columns([
+            pl.col("tpep_pickup_datetime").dt.hour().alias("pickup_hour"),
+            pl.col("tpep_pickup_datetime").dt.weekday().alias("pickup_weekday"),
+            pl.col("tpep_pickup_datetime").dt.date().alias("pickup_date"),
+            # Few distinct codes, so encode once for cheaper group_by/is_in
+            pl.col("payment_type").cast(pl.String).cast(pl.Categorical),
+
+            (
+                (pl.col("tpep_dropoff_datetime") - pl.col("tpep_pickup_datetime"))
+                .dt.total_seconds() / 60
+            ).alias("trip_duration_min"),
+
+            # Branchless: the clip keeps the division finite and the mask
+            # zeroes out non-positive fares
+            (
+                pl.col("tip_amount") / pl.col("fare_amount").clip(lower_bound=1e-9)
+                * 100
+                * (pl.col("fare_amount") > 0).cast(pl.Float32)
+            ).alias("tip_pct"),
+        ])
+        .filter(
+            (pl.col("fare_amount") > 0) & (pl.col("fare_amount") < 200) &
+            (pl.col("trip_distance") > 0) & (pl.col("trip_distance") < 50) &
+            (pl.col("trip_duration_min") > 1) & (pl.col("trip_duration_min") < 180)
+        )
+        # Narrower types halve the bytes every later scan has to touch
+        .with_columns([
+            pl.col("PULocationID").cast(pl.Int16),
+            pl.col([
+                "fare_amount", "tip_amount", "total_amount",
+                "trip_distance", "trip_duration_min", "tip_pct",
+            ]).cast(pl.Float32),
+        ])
+        .collect(engine="streaming")
+        .head(SAMPLE_SIZE)
+    )
+
+    return add_features(df)
+
+# Static lookup table: parse it once and share it across every session
+@st.cache_resource
+def get_zones():
+    ensure_file(zoneLookup, zoneLookupPath)
+    ensure_parquet(zoneLookupPath, zoneLookupParquetPath)
+
+    try:
+        # First try the local copy in the dashboard folder
+        zones_df = pl.read_parquet(zoneLookupParquetPath, memory_map=True)
+    except FileNotFoundError:
+        try:
+            # Maybe it's in the parent directory?
+            zones_df = pl.read_csv('../data/taxi_zone_lookup.csv')
+        except FileNotFoundError:
+            # Okay, we're stuck - let the user know what's up
+            st.error("Can't find the dataset! Make sure 'taxi_zone_lookup.csv' is in the dashboard folder.")
+            st.stop()
+    return zones_df
+
+# None of the charts depend on the sidebar, so build their data once per
+# loaded frame instead of on every widget interaction
+@st.cache_data(hash_funcs=FRAME_HASH_FUNCS)
+def precompute(df, zones_df):
+    lf = df.lazy()
+
+    top_pickups, avg_fare_by_hour = pl.collect_all([
+        lf
+        .group_by("PULocationID")
+        .agg(pl.len().alias("trip_count"))
+        .top_k(10, by="trip_count")
+        .join(zones_df.lazy(), left_on="PULocationID", right_on="LocationID")
+        # Neither top_k nor the join guarantees row order
+        .sort("trip_count", descending=True),
+
+        lf
+        .group_by("pickup_hour")
+        .agg(pl.col("fare_amount").mean().alias("avg_fare"))
+        .sort("pickup_hour"),
+    ])
+
+    # value_counts counts the categorical's physical codes directly
+    payment_counts = df["payment_type"].value_counts(name="count").sort("payment_type")
+
+    # Day x hour counts as a single bincount over flattened cell indices;
+    # pickup_weekday runs Mon=1..Sun=7, matching the heatmap's row labels
+    cell = df.select(
+        (pl.col("pickup_weekday").cast(pl.Int64) - 1) * 24 + pl.col("pickup_hour")
+    ).to_series().to_numpy()
+    heatmap = np.bincount(cell, minlength=7 * 24).reshape(7, 24)
+
+    return dict(
+        top_pickups=top_pickups,
+        avg_fare=avg_fare_by_hour,
+        hist=np.histogram(df["trip_distance"].to_numpy(), bins=40),
+        payments=payment_counts,
+        heatmap=heatmap,
+    )
+
+# Widget defaults only depend on the loaded frame, not on widget state
+@st.cache_data(hash_funcs=FRAME_HASH_FUNCS)
+def sidebar_opts(df):
+    return dict(
+        payments=sorted(df["payment_type"].unique().to_list()),
+        dmin=df["tpep_pickup_datetime"].min().date(),
+        dmax=df["tpep_pickup_datetime"].max().date(),
+    )
+
+def filter_trips(df, date_range, hour_range, payment_types):
+    # Compare the raw timestamps against [start, end + 1 day) rather than
+    # materializing a date column for every row
+    start = datetime.combine(date_range[0], datetime.min.time())
+    end = datetime.combine(date_range[1], datetime.min.time()) + timedelta(days=1)
+
+    # One lazy pass over the sample, keeping only the columns the metrics read
+    return (
+        df
+        .lazy()
+        .filter(
+            (pl.col("tpep_pickup_datetime").is_between(start, end, closed="left")) &
+            (pl.col("pickup_hour").is_between(hour_range[0], hour_range[1])) &
+            (pl.col("payment_type").is_in(payment_types))
+        )
+        .select(["fare_amount", "total_amount", "trip_distance", "trip_duration_minutes"])
+        .collect()
+    )
+
+def trip_stats(filtered_df):
+    # The sample is stored as Float32; reduce in 64 bits so totals keep their
+    # cents and the rounded values display cleanly
+    return filtered_df.with_columns(pl.col(pl.Float32).cast(pl.Float64)).select([
+        pl.len().alias("n"),
+        pl.col("fare_amount").mean().round(2).alias("avg_fare"),
+        pl.col("total_amount").sum().round(2).alias("rev"),
+        pl.col("trip_distance").mean().round(2).alias("avg_dist"),
+        pl.col("trip_duration_minutes").mean().round(2).alias("avg_dur"),
+    ]).row(0, named=True)